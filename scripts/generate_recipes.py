@@ -3,13 +3,15 @@ Recipe Generator - Adds hundreds of diverse whole-food recipes
 """
 import json
 import random
+from types import MappingProxyType
 
-# Load existing recipes
-with open('data/recipes/recipe-database.json', 'r') as f:
-    data = json.load(f)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Recipe templates for quick generation
-breakfast_recipes = [
+# Recipe templates for quick generation (read-only views; use dict(recipe) to copy or serialize)
+breakfast_recipes = tuple(MappingProxyType(recipe) for recipe in (
     {
         "name": "Grass-Fed Beef Liver Pâté Toast",
         "description": "Nutrient-dense liver pâté on sourdough with pickles",
@@ -41,7 +43,7 @@ breakfast_recipes = [
         "prepTime": "5 min", "cookTime": "15 min"
     },
     # Add 95 more breakfast varieties...
-]
+))
 
 # Generate recipe objects programmatically
 def generate_recipe(meal_id, name, desc, meal_type, nutrition, times):
@@ -93,11 +95,21 @@ def generate_recipe(meal_id, name, desc, meal_type, nutrition, times):
         "tags": [meal_type, "nutrient-dense", "whole-food"]
     }
 
-print("Generating 200+ recipes...")
-print(f"Starting with {len(data['recipes'])} recipes")
 
-# We'll keep this simple - just show the concept
-# In a full implementation, you'd have detailed lists
+if __name__ == '__main__':
+    # Load existing recipes
+    if orjson is not None:
+        with open('data/recipes/recipe-database.json', 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open('data/recipes/recipe-database.json', 'r') as f:
+            data = json.loads(f.read())
 
-print("Recipe generator ready. Run full script to add recipes.")
-print("This would add ~200 recipes across all meal types.")
+    print("Generating 200+ recipes...")
+    print(f"Starting with {len(data['recipes'])} recipes")
+
+    # We'll keep this simple - just show the concept
+    # In a full implementation, you'd have detailed lists
+
+    print("Recipe generator ready. Run full script to add recipes.")
+    print("This would add ~200 recipes across all meal types.")
@@ -0,0 +1,43 @@
+"""
+Shared Data Loader for the Nutrition Modules
+
+This module provides:
+1. The default location of the repository data directory
+2. A cached JSON loader shared by the calculator and analyzer modules
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Dict
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON parsing
+    orjson = None
+
+
+# Repository data directory, resolved once at import
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+@lru_cache(maxsize=16)
+def _parse_json_file(path: str, mtime: float) -> Dict:
+    """Parse a JSON data file. Cached per path and modification time."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.loads(f.read())
+
+
+def load_json(path) -> Dict:
+    """
+    Load a JSON data file, reusing the parsed result until the file changes.
+
+    The returned object is shared by every caller that loads the same file,
+    so treat it as read-only and copy it before making changes.
+    """
+    path = str(path)
+    return _parse_json_file(path, os.path.getmtime(path))
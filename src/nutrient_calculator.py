@@ -9,9 +9,74 @@ This module provides functionality to:
 """
 
 import json
+import re
+from functools import lru_cache
 from typing import Dict, List, Tuple
 from pathlib import Path
 
+from data_loader import DEFAULT_DATA_DIR, load_json
+
+
+# Nutrient groups in the order they appear in a totals dictionary
+NUTRIENT_CATEGORIES = ('macronutrients', 'vitamins', 'minerals', 'other')
+
+# Simplified conversion - would need comprehensive conversion table
+UNIT_TO_GRAMS = {
+    'g': 1,
+    'oz': 28.35,
+    'cup': 240,  # approximate, varies by ingredient
+    'tbsp': 15,
+    'tsp': 5,
+    'ml': 1,
+    'l': 1000
+}
+
+# Gram amount inside a serving size string such as "1 large (50g)"
+SERVING_GRAMS_PATTERN = re.compile(r'(\d+)g')
+
+# Substrings that mark a food ID as animal-sourced
+ANIMAL_FOOD_KEYWORDS = ('salmon', 'sardines', 'eggs', 'beef', 'liver', 'chicken', 'turkey', 'oysters', 'shrimp')
+
+# Nutrients checked for compliance, in report order:
+# (totals category, nutrient key, requirements section, requirement key)
+COMPLIANCE_CHECKS = (
+    ('macronutrients', 'protein_g', 'macronutrients', 'protein'),
+    ('macronutrients', 'carbohydrates_g', 'macronutrients', 'carbohydrates'),
+    ('macronutrients', 'fat_g', 'macronutrients', 'fats'),
+    ('macronutrients', 'fiber_g', 'macronutrients', 'fiber'),
+    ('vitamins', 'vitaminA_mcg', 'vitamins', 'vitaminA'),
+    ('vitamins', 'vitaminD_IU', 'vitamins', 'vitaminD'),
+    ('vitamins', 'vitaminE_mg', 'vitamins', 'vitaminE'),
+    ('vitamins', 'vitaminC_mg', 'vitamins', 'vitaminC'),
+    ('vitamins', 'thiamin_B1_mg', 'vitamins', 'thiamin_B1'),
+    ('vitamins', 'riboflavin_B2_mg', 'vitamins', 'riboflavin_B2'),
+    ('vitamins', 'niacin_B3_mg', 'vitamins', 'niacin_B3'),
+    ('vitamins', 'pyridoxine_B6_mg', 'vitamins', 'pyridoxine_B6'),
+    ('vitamins', 'folate_B9_mcg', 'vitamins', 'folate_B9'),
+    ('vitamins', 'cobalamin_B12_mcg', 'vitamins', 'cobalamin_B12'),
+    ('minerals', 'calcium_mg', 'minerals', 'calcium'),
+    ('minerals', 'iron_mg', 'minerals', 'iron'),
+    ('minerals', 'magnesium_mg', 'minerals', 'magnesium'),
+    ('minerals', 'potassium_mg', 'minerals', 'potassium'),
+    ('minerals', 'zinc_mg', 'minerals', 'zinc'),
+    ('minerals', 'selenium_mcg', 'minerals', 'selenium'),
+    ('other', 'choline_mg', 'other_nutrients', 'choline')
+)
+
+MEAL_TYPES = ('breakfast', 'lunch', 'dinner')
+
+WEEK_DAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+
+@lru_cache(maxsize=256)
+def _serving_size_grams(serving_size: str) -> float:
+    """Parse serving size string to grams. Cached since foods share a few sizes."""
+    # Simple parser - handles "100g", "1 large (50g)", etc.
+    match = SERVING_GRAMS_PATTERN.search(serving_size)
+    if match:
+        return float(match.group(1))
+    return 100.0  # default
+
 
 class NutrientCalculator:
     """Calculate and analyze nutrients from meal plans."""
@@ -24,30 +89,49 @@ class NutrientCalculator:
             data_dir: Path to data directory. Defaults to ../data from this file.
         """
         if data_dir is None:
-            data_dir = Path(__file__).parent.parent / "data"
+            data_dir = DEFAULT_DATA_DIR
         else:
             data_dir = Path(data_dir)
             
         self.data_dir = data_dir
         
+        # requirements, food_db and nutrient_interactions are shared through the
+        # load_json cache with every other instance: treat them as read-only and
+        # copy before modifying (e.g. for per-person requirement adjustments).
+        
         # Load nutrition requirements
         req_path = data_dir / "nutrition-requirements" / "optimal-nutrients-adult.json"
-        with open(req_path, 'r') as f:
-            self.requirements = json.load(f)
+        self.requirements = load_json(req_path)
             
         # Load food database
         food_path = data_dir / "foods" / "whole-foods-database.json"
-        with open(food_path, 'r') as f:
-            self.food_db = json.load(f)
+        self.food_db = load_json(food_path)
             
-        # Load nutrient interactions for bioavailability
+        # Load nutrient interactions for bioavailability (tracking disabled if absent)
         interactions_path = data_dir / "nutrition-requirements" / "nutrient-interactions.json"
-        try:
-            with open(interactions_path, 'r') as f:
-                self.nutrient_interactions = json.load(f)
-        except FileNotFoundError:
-            print("Warning: nutrient-interactions.json not found. Bioavailability tracking disabled.")
+        if interactions_path.is_file():
+            self.nutrient_interactions = load_json(interactions_path)
+        else:
             self.nutrient_interactions = None
+        
+        # Index foods by ID (lowercased name, spaces as underscores); first match wins
+        self._food_index = {}
+        for category_data in self.food_db.get('categories', {}).values():
+            for foods in category_data.values():
+                if isinstance(foods, list):
+                    for food in foods:
+                        food_id = food.get('name', '').lower().replace(' ', '_')
+                        self._food_index.setdefault(food_id, food)
+        
+        # Map each tracked nutrient key to its category so scaling is a single lookup.
+        # Categories are visited in reverse so that, if a key ever appeared in two
+        # categories, the earlier one would win - matching the original if/elif order.
+        template = self._init_nutrient_totals()
+        self._nutrient_category = {
+            key: category
+            for category in reversed(NUTRIENT_CATEGORIES)
+            for key in template[category]
+        }
     
     def calculate_meal_nutrients(self, ingredients: List[Dict], apply_bioavailability: bool = True) -> Dict:
         """
@@ -124,7 +208,7 @@ class NutrientCalculator:
         daily_totals = self._init_nutrient_totals()
         
         # Process main meals
-        for meal_type in ['breakfast', 'lunch', 'dinner']:
+        for meal_type in MEAL_TYPES:
             if meal_type in daily_meals:
                 meal = daily_meals[meal_type]
                 ingredients = meal.get('ingredients', [])
@@ -151,9 +235,8 @@ class NutrientCalculator:
             Tuple of (weekly_totals, daily_averages)
         """
         weekly_totals = self._init_nutrient_totals()
-        days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
         
-        for day in days:
+        for day in WEEK_DAYS:
             if day in weekly_plan:
                 daily_nutrients = self.calculate_daily_nutrients(weekly_plan[day])
                 self._add_nutrients(weekly_totals, daily_nutrients)
@@ -181,110 +264,20 @@ class NutrientCalculator:
             'compliancePercentage': 0
         }
         
-        # Extract macronutrients from requirements
-        macros = self.requirements.get('macronutrients', {})
-        vitamins = self.requirements.get('vitamins', {})
-        minerals = self.requirements.get('minerals', {})
-        other = self.requirements.get('other_nutrients', {})
-        
         total_checked = 0
         compliant_count = 0
         
-        # Check macronutrients
-        macro_map = {
-            'protein_g': ('protein', 'optimal_g'),
-            'carbohydrates_g': ('carbohydrates', 'optimal_g'),
-            'fat_g': ('fats', 'optimal_g'),
-            'fiber_g': ('fiber', 'optimal_g')
-        }
-        
-        for nutrient_key, (req_key, value_key) in macro_map.items():
-            if req_key in macros:
-                is_compliant, status = self._check_nutrient(
-                    daily_nutrients['macronutrients'].get(nutrient_key, 0),
-                    macros[req_key],
-                    nutrient_key
-                )
+        for category, nutrient_key, section, req_key in COMPLIANCE_CHECKS:
+            requirements = self.requirements.get(section, {})
+            if req_key in requirements:
                 total_checked += 1
-                if is_compliant:
-                    compliant_count += 1
-                    analysis['compliantNutrients'].append(status)
-                elif status['percentOfTarget'] < 100:
-                    analysis['deficientNutrients'].append(status)
-                else:
-                    analysis['excessiveNutrients'].append(status)
-        
-        # Check vitamins
-        vitamin_map = {
-            'vitaminA_mcg': ('vitaminA', 'optimal'),
-            'vitaminD_IU': ('vitaminD', 'optimal'),
-            'vitaminE_mg': ('vitaminE', 'optimal'),
-            'vitaminC_mg': ('vitaminC', 'optimal'),
-            'thiamin_B1_mg': ('thiamin_B1', 'optimal'),
-            'riboflavin_B2_mg': ('riboflavin_B2', 'optimal'),
-            'niacin_B3_mg': ('niacin_B3', 'optimal'),
-            'pyridoxine_B6_mg': ('pyridoxine_B6', 'optimal'),
-            'folate_B9_mcg': ('folate_B9', 'optimal'),
-            'cobalamin_B12_mcg': ('cobalamin_B12', 'optimal')
-        }
-        
-        for nutrient_key, (req_key, value_key) in vitamin_map.items():
-            if req_key in vitamins:
-                is_compliant, status = self._check_nutrient(
-                    daily_nutrients['vitamins'].get(nutrient_key, 0),
-                    vitamins[req_key],
+                if self._record_compliance(
+                    analysis,
+                    daily_nutrients[category].get(nutrient_key, 0),
+                    requirements[req_key],
                     nutrient_key
-                )
-                total_checked += 1
-                if is_compliant:
+                ):
                     compliant_count += 1
-                    analysis['compliantNutrients'].append(status)
-                elif status['percentOfTarget'] < 100:
-                    analysis['deficientNutrients'].append(status)
-                else:
-                    analysis['excessiveNutrients'].append(status)
-        
-        # Check minerals
-        mineral_map = {
-            'calcium_mg': ('calcium', 'optimal'),
-            'iron_mg': ('iron', 'optimal'),
-            'magnesium_mg': ('magnesium', 'optimal'),
-            'potassium_mg': ('potassium', 'optimal'),
-            'zinc_mg': ('zinc', 'optimal'),
-            'selenium_mcg': ('selenium', 'optimal')
-        }
-        
-        for nutrient_key, (req_key, value_key) in mineral_map.items():
-            if req_key in minerals:
-                is_compliant, status = self._check_nutrient(
-                    daily_nutrients['minerals'].get(nutrient_key, 0),
-                    minerals[req_key],
-                    nutrient_key
-                )
-                total_checked += 1
-                if is_compliant:
-                    compliant_count += 1
-                    analysis['compliantNutrients'].append(status)
-                elif status['percentOfTarget'] < 100:
-                    analysis['deficientNutrients'].append(status)
-                else:
-                    analysis['excessiveNutrients'].append(status)
-        
-        # Check choline
-        if 'choline' in other:
-            is_compliant, status = self._check_nutrient(
-                daily_nutrients['other'].get('choline_mg', 0),
-                other['choline'],
-                'choline_mg'
-            )
-            total_checked += 1
-            if is_compliant:
-                compliant_count += 1
-                analysis['compliantNutrients'].append(status)
-            elif status['percentOfTarget'] < 100:
-                analysis['deficientNutrients'].append(status)
-            else:
-                analysis['excessiveNutrients'].append(status)
         
         # Calculate compliance percentage
         if total_checked > 0:
@@ -380,69 +373,44 @@ class NutrientCalculator:
     
     def _find_food(self, food_id: str) -> Dict:
         """Find food in database by ID."""
-        # Search through all categories
-        for category_name, category_data in self.food_db.get('categories', {}).items():
-            for subcategory_name, foods in category_data.items():
-                if isinstance(foods, list):
-                    for food in foods:
-                        if food.get('name', '').lower().replace(' ', '_') == food_id.lower():
-                            return food
-        return None
+        return self._food_index.get(food_id.lower())
     
     def _parse_serving_size(self, serving_size: str) -> float:
         """Parse serving size string to grams."""
-        # Simple parser - handles "100g", "1 large (50g)", etc.
-        import re
-        match = re.search(r'(\d+)g', serving_size)
-        if match:
-            return float(match.group(1))
-        return 100.0  # default
+        return _serving_size_grams(serving_size)
     
     def _convert_to_grams(self, amount: float, unit: str) -> float:
         """Convert various units to grams."""
-        # Simplified conversion - would need comprehensive conversion table
-        conversions = {
-            'g': 1,
-            'oz': 28.35,
-            'cup': 240,  # approximate, varies by ingredient
-            'tbsp': 15,
-            'tsp': 5,
-            'ml': 1,
-            'l': 1000
-        }
-        return amount * conversions.get(unit.lower(), 1)
+        if unit == 'g':
+            return amount
+        return amount * UNIT_TO_GRAMS.get(unit.lower(), 1)
     
     def _add_scaled_nutrients(self, totals: Dict, nutrients: Dict, scale: float):
         """Add scaled nutrients to totals."""
+        nutrient_category = self._nutrient_category
         for key, value in nutrients.items():
-            if isinstance(value, (int, float)):
-                # Determine which category this nutrient belongs to
-                if key in totals['macronutrients']:
-                    totals['macronutrients'][key] += value * scale
-                elif key in totals['vitamins']:
-                    totals['vitamins'][key] += value * scale
-                elif key in totals['minerals']:
-                    totals['minerals'][key] += value * scale
-                elif key in totals['other']:
-                    totals['other'][key] += value * scale
+            category = nutrient_category.get(key)
+            if category is not None and isinstance(value, (int, float)):
+                totals[category][key] += value * scale
     
     def _add_nutrients(self, totals: Dict, nutrients: Dict):
         """Add nutrients from one dict to another."""
         totals['calories'] += nutrients.get('calories', 0)
         
-        for category in ['macronutrients', 'vitamins', 'minerals', 'other']:
+        for category in NUTRIENT_CATEGORIES:
             if category in nutrients:
                 for key, value in nutrients[category].items():
                     totals[category][key] += value
     
     def _divide_nutrients(self, nutrients: Dict, divisor: float) -> Dict:
         """Divide all nutrient values by a number (for averaging)."""
-        result = self._init_nutrient_totals()
-        result['calories'] = nutrients['calories'] / divisor
+        result = {'calories': nutrients['calories'] / divisor}
         
-        for category in ['macronutrients', 'vitamins', 'minerals', 'other']:
-            for key, value in nutrients[category].items():
-                result[category][key] = round(value / divisor, 2)
+        for category in NUTRIENT_CATEGORIES:
+            result[category] = {
+                key: round(value / divisor, 2)
+                for key, value in nutrients[category].items()
+            }
         
         return result
     
@@ -473,11 +441,29 @@ class NutrientCalculator:
         
         return is_compliant, status
     
+    def _record_compliance(self, analysis: Dict, actual: float, requirement: Dict, nutrient_name: str) -> bool:
+        """
+        Check one nutrient and file its status under the matching analysis list.
+        
+        Returns:
+            True if the nutrient is within its optimal range
+        """
+        is_compliant, status = self._check_nutrient(actual, requirement, nutrient_name)
+        
+        if is_compliant:
+            analysis['compliantNutrients'].append(status)
+        elif status['percentOfTarget'] < 100:
+            analysis['deficientNutrients'].append(status)
+        else:
+            analysis['excessiveNutrients'].append(status)
+        
+        return is_compliant
+    
     def _get_food_type(self, food_id: str) -> str:
         """Determine if food is animal or plant-based for bioavailability calculations."""
-        animal_foods = ['salmon', 'sardines', 'eggs', 'beef', 'liver', 'chicken', 'turkey', 'oysters', 'shrimp']
-        for animal in animal_foods:
-            if animal in food_id.lower():
+        food_id = food_id.lower()
+        for animal in ANIMAL_FOOD_KEYWORDS:
+            if animal in food_id:
                 return 'animal'
         return 'plant'
     
@@ -496,11 +482,11 @@ class NutrientCalculator:
             return totals
         
         bio_factors = self.nutrient_interactions.get('bioavailabilityFactors', {})
+        has_animal = len(food_sources['animal_foods']) > 0
         
         # Iron bioavailability
         if 'iron' in bio_factors:
             iron_total = totals['minerals']['iron_mg']
-            has_animal = len(food_sources['animal_foods']) > 0
             has_vitamin_c = food_sources['has_vitamin_c']
             
             if has_animal:
@@ -522,7 +508,6 @@ class NutrientCalculator:
         # Vitamin A bioavailability (retinol vs beta-carotene)
         if 'vitaminA' in bio_factors:
             vitamin_a_total = totals['vitamins']['vitaminA_mcg']
-            has_animal = len(food_sources['animal_foods']) > 0
             has_fat = food_sources['has_fat']
             
             if has_animal:
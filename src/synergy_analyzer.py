@@ -12,6 +12,43 @@ import json
 from typing import Dict, List
 from pathlib import Path
 
+from data_loader import DEFAULT_DATA_DIR, load_json
+
+
+# Map nutrient names to (category, key, minimum amount) for "present" checks
+NUTRIENT_THRESHOLDS = {
+    'calcium': ('minerals', 'calcium_mg', 150),  # 15% of 1000mg
+    'vitaminD': ('vitamins', 'vitaminD_IU', 400),  # 15% of 2500 IU
+    'vitaminK2': ('vitamins', 'vitaminK2_mcg', 15),  # 15% of 100mcg
+    'magnesium': ('minerals', 'magnesium_mg', 60),  # 15% of 400mg
+    'iron': ('minerals', 'iron_mg', 2),  # 15% of 15mg
+    'vitaminC': ('vitamins', 'vitaminC_mg', 25),  # 15% of 150mg
+    'zinc': ('minerals', 'zinc_mg', 1.5),  # 15% of 10mg
+    'copper': ('minerals', 'copper_mg', 0.15),  # 15% of 1mg
+    'vitaminE': ('vitamins', 'vitaminE_mg', 3),  # 15% of 20mg
+    'vitaminA': ('vitamins', 'vitaminA_mcg', 150),  # 15% of 1000mcg
+    'selenium': ('minerals', 'selenium_mcg', 30),  # 15% of 200mcg
+}
+
+# Food sources suggested for each missing synergy nutrient
+FOOD_SUGGESTIONS = {
+    'calcium': ['Grass-fed yogurt (300mg per cup)', 'Sardines with bones (350mg per 100g)', 'Kale (150mg per cup)'],
+    'vitaminD': ['Wild salmon (600 IU per 100g)', 'Pastured egg yolks (50 IU per yolk)', 'UV-exposed mushrooms (400 IU per 100g)'],
+    'vitaminK2': ['Grass-fed cheese (50mcg per oz)', 'Natto (850mcg per 100g)', 'Pastured egg yolks (15mcg per yolk)'],
+    'magnesium': ['Pumpkin seeds (150mg per oz)', 'Spinach (157mg per cup cooked)', 'Dark chocolate (95mg per oz)'],
+    'iron': ['Grass-fed beef (3mg per 100g)', 'Liver (6mg per 100g)', 'Lentils with vitamin C (3mg per cup)'],
+    'vitaminC': ['Red bell pepper (190mg per pepper)', 'Strawberries (90mg per cup)', 'Broccoli (80mg per cup)'],
+    'zinc': ['Oysters (78mg per 100g)', 'Grass-fed beef (7mg per 100g)', 'Pumpkin seeds (10mg per oz)'],
+    'copper': ['Beef liver (14mg per 100g)', 'Oysters (7mg per 100g)', 'Cashews (2mg per oz)']
+}
+
+# Bone Health Trio completions as (missing nutrient, suggestion), in display order
+BONE_HEALTH_FOODS = (
+    ('Vitamin D', 'Add 100g wild salmon (+600 IU vitamin D)'),
+    ('Vitamin K2', 'Add 1oz grass-fed cheese (+50mcg vitamin K2)'),
+    ('Magnesium', 'Add 1oz pumpkin seeds (+150mg magnesium)'),
+)
+
 
 class SynergyAnalyzer:
     """Analyze nutrient synergies and antagonisms in meals."""
@@ -24,14 +61,13 @@ class SynergyAnalyzer:
             data_dir: Path to data directory. Defaults to ../data from this file.
         """
         if data_dir is None:
-            data_dir = Path(__file__).parent.parent / "data"
+            data_dir = DEFAULT_DATA_DIR
         else:
             data_dir = Path(data_dir)
         
-        # Load nutrient interactions
+        # Load nutrient interactions (shared through the load_json cache: read-only)
         interactions_path = data_dir / "nutrition-requirements" / "nutrient-interactions.json"
-        with open(interactions_path, 'r') as f:
-            self.interactions = json.load(f)
+        self.interactions = load_json(interactions_path)
         
         self.synergies = self.interactions.get('nutrientSynergies', {})
         self.food_combinations = self.interactions.get('foodCombinations', {})
@@ -112,9 +148,9 @@ class SynergyAnalyzer:
         for meal_time, meal in daily_meals.items():
             if not meal:
                 continue
-            nutrients = meal.get('nutrients', {})
-            iron = nutrients.get('minerals', {}).get('iron_mg', 0)
-            calcium = nutrients.get('minerals', {}).get('calcium_mg', 0)
+            minerals = meal.get('nutrients', {}).get('minerals', {})
+            iron = minerals.get('iron_mg', 0)
+            calcium = minerals.get('calcium_mg', 0)
             
             if iron > 5:  # Significant iron
                 iron_meals.append(meal_time)
@@ -145,11 +181,14 @@ class SynergyAnalyzer:
         """
         suggestions = []
         
+        minerals = meal_nutrients.get('minerals', {})
+        vitamins = meal_nutrients.get('vitamins', {})
+        
         # Check bone health synergy (most important)
-        has_calcium = meal_nutrients.get('minerals', {}).get('calcium_mg', 0) > 200
-        has_vitamin_d = meal_nutrients.get('vitamins', {}).get('vitaminD_IU', 0) > 200
-        has_vitamin_k2 = meal_nutrients.get('vitamins', {}).get('vitaminK2_mcg', 0) > 10
-        has_magnesium = meal_nutrients.get('minerals', {}).get('magnesium_mg', 0) > 50
+        has_calcium = minerals.get('calcium_mg', 0) > 200
+        has_vitamin_d = vitamins.get('vitaminD_IU', 0) > 200
+        has_vitamin_k2 = vitamins.get('vitaminK2_mcg', 0) > 10
+        has_magnesium = minerals.get('magnesium_mg', 0) > 50
         
         if has_calcium:
             missing = []
@@ -169,8 +208,8 @@ class SynergyAnalyzer:
                 })
         
         # Check iron absorption complex
-        has_iron = meal_nutrients.get('minerals', {}).get('iron_mg', 0) > 3
-        has_vitamin_c = meal_nutrients.get('vitamins', {}).get('vitaminC_mg', 0) > 25
+        has_iron = minerals.get('iron_mg', 0) > 3
+        has_vitamin_c = vitamins.get('vitaminC_mg', 0) > 25
         
         if has_iron and not has_vitamin_c:
             suggestions.append({
@@ -216,25 +255,10 @@ class SynergyAnalyzer:
             nutrients: Nutrient totals dict
             threshold_percent: Minimum % of daily needs to count as "present"
         """
-        # Map nutrient names to keys and thresholds
-        nutrient_thresholds = {
-            'calcium': ('minerals', 'calcium_mg', 150),  # 15% of 1000mg
-            'vitaminD': ('vitamins', 'vitaminD_IU', 400),  # 15% of 2500 IU
-            'vitaminK2': ('vitamins', 'vitaminK2_mcg', 15),  # 15% of 100mcg
-            'magnesium': ('minerals', 'magnesium_mg', 60),  # 15% of 400mg
-            'iron': ('minerals', 'iron_mg', 2),  # 15% of 15mg
-            'vitaminC': ('vitamins', 'vitaminC_mg', 25),  # 15% of 150mg
-            'zinc': ('minerals', 'zinc_mg', 1.5),  # 15% of 10mg
-            'copper': ('minerals', 'copper_mg', 0.15),  # 15% of 1mg
-            'vitaminE': ('vitamins', 'vitaminE_mg', 3),  # 15% of 20mg
-            'vitaminA': ('vitamins', 'vitaminA_mcg', 150),  # 15% of 1000mcg
-            'selenium': ('minerals', 'selenium_mcg', 30),  # 15% of 200mcg
-        }
-        
-        if nutrient_name not in nutrient_thresholds:
+        if nutrient_name not in NUTRIENT_THRESHOLDS:
             return False
         
-        category, key, threshold = nutrient_thresholds[nutrient_name]
+        category, key, threshold = NUTRIENT_THRESHOLDS[nutrient_name]
         value = nutrients.get(category, {}).get(key, 0)
         
         return value >= threshold
@@ -243,10 +267,13 @@ class SynergyAnalyzer:
         """Check for nutrient antagonisms (combinations that interfere with absorption)."""
         antagonisms = []
         
-        calcium = nutrients.get('minerals', {}).get('calcium_mg', 0)
-        iron = nutrients.get('minerals', {}).get('iron_mg', 0)
-        zinc = nutrients.get('minerals', {}).get('zinc_mg', 0)
-        copper = nutrients.get('minerals', {}).get('copper_mg', 0)
+        minerals = nutrients.get('minerals', {})
+        vitamins = nutrients.get('vitamins', {})
+        
+        calcium = minerals.get('calcium_mg', 0)
+        iron = minerals.get('iron_mg', 0)
+        zinc = minerals.get('zinc_mg', 0)
+        copper = minerals.get('copper_mg', 0)
         
         # Calcium + Iron antagonism
         if calcium > 300 and iron > 5:
@@ -272,10 +299,10 @@ class SynergyAnalyzer:
         
         # Fiber + Fat-soluble vitamins
         fiber = nutrients.get('macronutrients', {}).get('fiber_g', 0)
-        fat_sol_vitamins = (nutrients.get('vitamins', {}).get('vitaminA_mcg', 0) + 
-                           nutrients.get('vitamins', {}).get('vitaminD_IU', 0) / 40 +
-                           nutrients.get('vitamins', {}).get('vitaminE_mg', 0) +
-                           nutrients.get('vitamins', {}).get('vitaminK_mcg', 0) / 10)
+        fat_sol_vitamins = (vitamins.get('vitaminA_mcg', 0) + 
+                           vitamins.get('vitaminD_IU', 0) / 40 +
+                           vitamins.get('vitaminE_mg', 0) +
+                           vitamins.get('vitaminK_mcg', 0) / 10)
         
         if fiber > 15 and fat_sol_vitamins > 100:
             antagonisms.append({
@@ -292,9 +319,12 @@ class SynergyAnalyzer:
         """Get timing recommendations based on circadian nutrition principles."""
         recommendations = []
         
-        protein = nutrients.get('macronutrients', {}).get('protein_g', 0)
-        carbs = nutrients.get('macronutrients', {}).get('carbohydrates_g', 0)
-        magnesium = nutrients.get('minerals', {}).get('magnesium_mg', 0)
+        macros = nutrients.get('macronutrients', {})
+        minerals = nutrients.get('minerals', {})
+        
+        protein = macros.get('protein_g', 0)
+        carbs = macros.get('carbohydrates_g', 0)
+        magnesium = minerals.get('magnesium_mg', 0)
         
         if protein > 30:
             recommendations.append("✓ High protein content - ideal for morning or post-workout to maximize muscle protein synthesis")
@@ -306,7 +336,7 @@ class SynergyAnalyzer:
             recommendations.append("✓ High magnesium - best consumed in evening for relaxation and sleep support")
         
         # Check for tea/coffee with iron-rich meal
-        has_iron = nutrients.get('minerals', {}).get('iron_mg', 0) > 5
+        has_iron = minerals.get('iron_mg', 0) > 5
         if has_iron:
             recommendations.append("⚠️ Iron-rich meal - avoid tea/coffee for 1-2 hours before and after (tannins reduce iron absorption by 60-70%)")
         
@@ -314,36 +344,16 @@ class SynergyAnalyzer:
     
     def _get_food_suggestions(self, missing_nutrients: List[str]) -> List[str]:
         """Get food suggestions for missing nutrients."""
-        food_map = {
-            'calcium': ['Grass-fed yogurt (300mg per cup)', 'Sardines with bones (350mg per 100g)', 'Kale (150mg per cup)'],
-            'vitaminD': ['Wild salmon (600 IU per 100g)', 'Pastured egg yolks (50 IU per yolk)', 'UV-exposed mushrooms (400 IU per 100g)'],
-            'vitaminK2': ['Grass-fed cheese (50mcg per oz)', 'Natto (850mcg per 100g)', 'Pastured egg yolks (15mcg per yolk)'],
-            'magnesium': ['Pumpkin seeds (150mg per oz)', 'Spinach (157mg per cup cooked)', 'Dark chocolate (95mg per oz)'],
-            'iron': ['Grass-fed beef (3mg per 100g)', 'Liver (6mg per 100g)', 'Lentils with vitamin C (3mg per cup)'],
-            'vitaminC': ['Red bell pepper (190mg per pepper)', 'Strawberries (90mg per cup)', 'Broccoli (80mg per cup)'],
-            'zinc': ['Oysters (78mg per 100g)', 'Grass-fed beef (7mg per 100g)', 'Pumpkin seeds (10mg per oz)'],
-            'copper': ['Beef liver (14mg per 100g)', 'Oysters (7mg per 100g)', 'Cashews (2mg per oz)']
-        }
-        
         suggestions = []
         for nutrient in missing_nutrients:
-            if nutrient in food_map:
-                suggestions.extend(food_map[nutrient])
+            if nutrient in FOOD_SUGGESTIONS:
+                suggestions.extend(FOOD_SUGGESTIONS[nutrient])
         
         return suggestions
     
     def _get_bone_health_foods(self, missing_nutrients: List[str]) -> List[str]:
         """Get specific bone health food suggestions."""
-        suggestions = []
-        
-        if 'Vitamin D' in missing_nutrients:
-            suggestions.append('Add 100g wild salmon (+600 IU vitamin D)')
-        if 'Vitamin K2' in missing_nutrients:
-            suggestions.append('Add 1oz grass-fed cheese (+50mcg vitamin K2)')
-        if 'Magnesium' in missing_nutrients:
-            suggestions.append('Add 1oz pumpkin seeds (+150mg magnesium)')
-        
-        return suggestions
+        return [food for nutrient, food in BONE_HEALTH_FOODS if nutrient in missing_nutrients]
 
 
 if __name__ == "__main__":